@@ -1,15 +1,16 @@
 #!/usr/bin/env python3
 
-import os, sys, json, ssl, smtplib, datetime, html
-from email.mime.multipart import MIMEMultipart
-from email.mime.text import MIMEText
-from email.utils import formatdate
+import os, sys, ssl, smtplib, datetime, html, asyncio, time, threading, functools, base64, uuid
+from email.header import Header
+from email.utils import formatdate, formataddr, parseaddr
 from pathlib import Path
-from collections import defaultdict
-import requests
+from urllib.parse import urlencode
+import httpx
+import orjson
 
 GITHUB_API = "https://api.github.com"
 SEARCH_ISSUES = f"{GITHUB_API}/search/issues"
+RETRY_STATUS = (502, 503, 504)
 
 def env(name, default=None, required=False):
     v = os.getenv(name, default)
@@ -26,6 +27,8 @@ SMTP_PASS    = env("SMTP_PASS")
 MAIL_TO      = env("MAIL_TO")
 MAIL_FROM    = env("MAIL_FROM")
 
+SMTP_IDLE_TIMEOUT = int(env("SMTP_IDLE_TIMEOUT", "30"))
+
 TG_BOT_TOKEN = env("TG_BOT_TOKEN")
 TG_CHAT_ID   = env("TG_CHAT_ID")
 
@@ -33,12 +36,15 @@ FILTER_LINKED_PR     = env("FILTER_LINKED_PR", "1")
 MAX_TIMELINE_CHECKS  = int(env("MAX_TIMELINE_CHECKS", "60"))
 TIMELINE_MAX_PAGES   = int(env("TIMELINE_MAX_PAGES", "2"))
 HTTP_TIMEOUT         = int(env("HTTP_TIMEOUT", "45"))
+CONCURRENCY          = int(env("CONCURRENCY", "5"))
+HTTP_RETRIES         = int(env("HTTP_RETRIES", "3"))
+
+GH_HEADERS = {"Accept": "application/vnd.github+json", "Authorization": f"Bearer {GH_TOKEN}"}
 
 def read_json(path, default=None):
     p = Path(path)
     if not p.exists(): return default
-    with p.open("r", encoding="utf-8") as f:
-        return json.load(f)
+    return orjson.loads(p.read_bytes())
 
 cfgA = read_json("config.json", default={"queries": [], "interval_minutes": 30, "max_results": 100})
 cfgB = read_json("targets.json", default={"repos": [], "labels": [], "exclude_labels": [], "interval_minutes": 30, "max_results": 100})
@@ -46,6 +52,11 @@ cfgB = read_json("targets.json", default={"repos": [], "labels": [], "exclude_la
 INTERVAL_MIN = int(os.getenv("INTERVAL_MIN") or cfgA.get("interval_minutes") or cfgB.get("interval_minutes") or 30)
 MAX_RESULTS  = int(os.getenv("MAX_RESULTS")  or cfgA.get("max_results")      or cfgB.get("max_results")      or 100)
 
+CACHE_PATH    = Path(env("CACHE_PATH", ".cache/zealot-http.json"))
+CACHE_TTL     = int(env("CACHE_TTL", str(max(60, INTERVAL_MIN * 30))))
+CACHE_MAX_AGE = int(env("CACHE_MAX_AGE", "86400"))
+HTTP_CACHE = {}
+
 def build_queries_from_targets(cfg):
     repos = cfg.get("repos", [])
     labels = cfg.get("labels", [])
@@ -67,192 +78,359 @@ if not ALL_QUERIES:
     print("[ERR] Require config.json/targets.json", file=sys.stderr)
     sys.exit(1)
 
+def write_report(path, text):
+    data = memoryview(text.encode("utf-8"))
+    fd = os.open(path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
 def iso_utc(dt):
     return dt.strftime("%Y-%m-%dT%H:%M:%SZ")
 
 def plural(n, word):
     return f"{n} {word}" if n == 1 else f"{n} {word}s"
 
-def gh_search(q, since_iso):
+def load_http_cache():
+    try:
+        data = read_json(CACHE_PATH, default={})
+    except orjson.JSONDecodeError as e:
+        print(f"[WARN] Ignoring unreadable cache {CACHE_PATH}: {e}", file=sys.stderr)
+        return
+    if not isinstance(data, dict):
+        print(f"[WARN] Ignoring malformed cache {CACHE_PATH}", file=sys.stderr)
+        return
+    HTTP_CACHE.update((k, v) for k, v in data.items()
+                      if isinstance(v, dict) and isinstance(v.get("ts"), (int, float)) and "value" in v)
+
+def save_http_cache():
+    cutoff = time.time() - CACHE_MAX_AGE
+    fresh = {k: v for k, v in HTTP_CACHE.items() if v.get("ts", 0) >= cutoff}
+    CACHE_PATH.parent.mkdir(parents=True, exist_ok=True)
+    tmp = CACHE_PATH.with_name(CACHE_PATH.name + ".tmp")
+    tmp.write_bytes(orjson.dumps(fresh))
+    os.replace(tmp, CACHE_PATH)
+
+async def gh_get(client, sem, url, params, headers=None, summarize=None):
+    # With summarize, the response is cached and only summarize(body) is stored and returned
+    key = f"{url}?{urlencode(sorted(params.items()))}"
+    entry = HTTP_CACHE.get(key) if summarize else None
+    if entry and time.time() - entry["ts"] < CACHE_TTL:
+        return entry["value"]
+    headers = {**GH_HEADERS, **(headers or {})}
+    if entry and entry.get("etag"):
+        headers["If-None-Match"] = entry["etag"]
+
+    for attempt in range(HTTP_RETRIES + 1):
+        try:
+            async with sem:
+                r = await client.get(url, params=params, headers=headers)
+            if r.status_code == 304:
+                if not entry:
+                    return None
+                entry["ts"] = time.time()
+                return entry["value"]
+            if r.status_code not in RETRY_STATUS or attempt == HTTP_RETRIES:
+                r.raise_for_status()
+                body = orjson.loads(r.content)
+                if summarize:
+                    body = summarize(body)
+                    HTTP_CACHE[key] = {"ts": time.time(), "etag": r.headers.get("ETag"), "value": body}
+                return body
+        except httpx.TransportError:
+            if attempt == HTTP_RETRIES:
+                raise
+        await asyncio.sleep(0.3 * 2 ** attempt)
+
+async def gh_search(q, since_iso, since_http, client, sem):
     query = f"{q} updated:>={since_iso}"
-    headers = {"Accept": "application/vnd.github+json", "Authorization": f"Bearer {GH_TOKEN}"}
     per_page = min(MAX_RESULTS, 100)
     max_pages = int(os.getenv("PAGINATE_PAGES", "3"))
 
-    items, page = [], 1
-    while page <= max_pages and len(items) < MAX_RESULTS:
-        params = {"q": query, "sort": "updated", "order": "desc", "per_page": per_page, "page": page}
-        r = requests.get(SEARCH_ISSUES, params=params, headers=headers, timeout=HTTP_TIMEOUT)
-        r.raise_for_status()
-        chunk = r.json().get("items", [])
-        if not chunk:
-            break
+    if max_pages < 1:
+        return []
+
+    def params(page):
+        return {"q": query, "sort": "updated", "order": "desc", "per_page": per_page, "page": page}
+
+    # A 304 means nothing matching the query changed since the window start.
+    # The query embeds since_iso, so responses are never reusable across runs and are not cached.
+    headers = {"If-Modified-Since": since_http}
+    first = await gh_get(client, sem, SEARCH_ISSUES, params(1), headers)
+    if first is None:
+        return []
+    items = list(first.get("items", []))
+    if len(items) < per_page:
+        return items[:MAX_RESULTS]
+
+    # total_count tells us how many more pages exist, so fetch them all at once
+    total = min(first.get("total_count", 0), MAX_RESULTS)
+    last_page = min(max_pages, -(-total // per_page))
+    rest = await asyncio.gather(*[gh_get(client, sem, SEARCH_ISSUES, params(p), headers)
+                                  for p in range(2, last_page + 1)])
+    for body in rest:
+        chunk = (body or {}).get("items", [])
         items.extend(chunk)
         if len(chunk) < per_page:
             break
-        page += 1
     return items[:MAX_RESULTS]
 
-def issue_has_open_linked_pr(repo_full_name: str, issue_number: int) -> bool:
-    headers = {
-        "Accept": "application/vnd.github+json",
-        "Authorization": f"Bearer {GH_TOKEN}",
-    }
+def summarize_timeline_page(data):
+    has_open_pr = False
+    for ev in data:
+        if ev.get("event") != "cross-referenced":
+            continue
+        source = ev.get("source") or {}
+        src_issue = source.get("issue") or {}
+        if "pull_request" in src_issue:
+            if (src_issue.get("state") or "").lower() == "open":
+                has_open_pr = True
+                break
+    return {"has_open_pr": has_open_pr, "count": len(data)}
+
+async def issue_has_open_linked_pr(client, sem, repo: str, issue_number: int) -> bool:
     page = 1
     per_page = 100
     while page <= TIMELINE_MAX_PAGES:
-        url = f"{GITHUB_API}/repos/{repo_full_name}/issues/{issue_number}/timeline"
+        url = f"{GITHUB_API}/repos/{repo}/issues/{issue_number}/timeline"
         params = {"per_page": per_page, "page": page}
         try:
-            resp = requests.get(url, headers=headers, params=params, timeout=HTTP_TIMEOUT)
-            if resp.status_code >= 400:
-                return False
-            data = resp.json()
-        except Exception:
+            summary = await gh_get(client, sem, url, params, summarize=summarize_timeline_page)
+        except (httpx.HTTPError, orjson.JSONDecodeError):
             return False
 
-        for ev in data:
-            if ev.get("event") != "cross-referenced":
-                continue
-            source = ev.get("source") or {}
-            src_issue = source.get("issue") or {}
-            if "pull_request" in src_issue:
-                if (src_issue.get("state") or "").lower() == "open":
-                    return True
-
-        if len(data) < per_page:
+        if summary["has_open_pr"]:
+            return True
+        if summary["count"] < per_page:
             break
         page += 1
 
     return False
 
-def label_span(label):
-    name = html.escape(label.get("name", ""))
-    color = label.get("color") or "dddddd"
+# (repo_full_name, issue_number) -> has an open linked PR
+checked_cache = {}
+# repository_url -> "owner/repo"
+_repo_cache = {}
+
+def repo_full_name(it):
+    repo_url = it["repository_url"]
+    repo = _repo_cache.get(repo_url)
+    if repo is None:
+        repo = _repo_cache[repo_url] = "/".join(repo_url.rsplit("/", 2)[-2:])
+    return repo
+
+@functools.lru_cache(maxsize=4096)
+def _label_span_cached(name: str, color: str) -> str:
+    name = html.escape(name)
+    # Rec. 709 luminance scaled by 10000 so the comparison stays in ints
     try:
-        r = int(color[0:2], 16); g = int(color[2:4], 16); b = int(color[4:6], 16)
-        luminance = 0.2126*r + 0.7152*g + 0.0722*b
-    except Exception:
-        luminance = 200
-    text_color = "#000000" if luminance > 160 else "#ffffff"
+        c = int(color[0:6], 16) if len(color) >= 6 else -1
+    except ValueError:
+        c = -1
+    if c < 0:
+        light = True
+    else:
+        light = 2126*(c >> 16) + 7152*((c >> 8) & 0xff) + 722*(c & 0xff) > 1_600_000
+    text_color = "#000000" if light else "#ffffff"
     return (f'<span style="display:inline-block; padding:2px 6px; margin:2px 4px 2px 0; '
             f'border-radius:12px; background-color: #{color}; color:{text_color}; '
             f'font-size:12px; line-height:18px; font-family:ui-sans-serif,system-ui,Arial">{name}</span>')
 
-def html_table_for_repo(repo, items):
-    rows = []
+def label_span(label):
+    return _label_span_cached(label.get("name", ""), label.get("color") or "dddddd")
+
+_FONT = "font-family:ui-sans-serif,system-ui,Arial;"
+_TD = "padding:8px; border:1px solid #ddd;"
+_TD_NOWRAP = f"{_TD} white-space:nowrap;"
+
+_TABLE_HEAD = (
+    f'<table role="grid" style="border-collapse:collapse; width:100%; max-width:100%; {_FONT} font-size:14px;">'
+    '<thead><tr style="background:#f6f8fa;">'
+    + "".join(f'<th style="{_TD} text-align:left;">{col}</th>'
+              for col in ("Issue", "Title", "Labels", "Assignees", "State", "Updated", "Created"))
+    + '</tr></thead><tbody>'
+)
+_TABLE_TAIL = '</tbody></table>'
+_REPO_HEADER_TMPL = (f'<h3 style="margin:20px 0 8px; {_FONT}">'
+                     '<a href="https://github.com/{repo}" style="text-decoration:none; color:#24292f;">{repo_html}</a></h3>')
+_ROW_TMPL = (
+    f'<tr><td style="{_TD_NOWRAP}"><a href="{{url}}" style="text-decoration:none;">#{{num}}</a></td>'
+    f'<td style="{_TD}"><a href="{{url}}" style="text-decoration:none; color:#0969da;"><strong>{{title}}</strong></a></td>'
+    f'<td style="{_TD}">{{labels}}</td>'
+    f'<td style="{_TD_NOWRAP}">{{assignees}}</td>'
+    f'<td style="{_TD} text-transform:capitalize; white-space:nowrap;">{{state}}</td>'
+    f'<td style="{_TD_NOWRAP}">{{updated}}</td>'
+    f'<td style="{_TD_NOWRAP}">{{created}}</td></tr>'
+)
+_WRAPPER_OPEN = f'<div style="{_FONT} font-size:14px;">'
+_WRAPPER_CLOSE = '<div style="margin-top:16px; color:#57606a;">-- Powered by Zealot</div></div>'
+
+def write_repo_table(out, repo, items):
+    w = out.append
+    escape = html.escape
+    row = _ROW_TMPL.format_map
+    w(_REPO_HEADER_TMPL.format_map({"repo": repo, "repo_html": escape(repo)}))
+    w(_TABLE_HEAD)
+
     for it in items:
-        num    = it.get("number")
-        title  = html.escape(it.get("title", ""))
-        url    = it.get("html_url")
-        updated = it.get("updated_at","")
-        created = it.get("created_at","")
-        labels_html = "".join([label_span(lb) for lb in it.get("labels", [])])
-
-        state = (it.get("state") or "").lower()
         assignees = it.get("assignees") or []
-        assignee_names = ", ".join([a.get("login","") for a in assignees]) if assignees else "--"
-
-        title_html = f'<a href="{url}" style="text-decoration:none; color:#0969da;"><strong>{title}</strong></a>'
-
-        rows.append(f"""
-          <tr>
-            <td style="padding:8px; border:1px solid #ddd; white-space:nowrap;">
-              <a href="{url}" style="text-decoration:none;">#{num}</a>
-            </td>
-            <td style="padding:8px; border:1px solid #ddd;">{title_html}</td>
-            <td style="padding:8px; border:1px solid #ddd;">{labels_html}</td>
-            <td style="padding:8px; border:1px solid #ddd; white-space:nowrap;">{assignee_names}</td>
-            <td style="padding:8px; border:1px solid #ddd; text-transform:capitalize; white-space:nowrap;">{state or "—"}</td>
-            <td style="padding:8px; border:1px solid #ddd; white-space:nowrap;">{updated}</td>
-            <td style="padding:8px; border:1px solid #ddd; white-space:nowrap;">{created}</td>
-          </tr>
-        """)
-
-    repo_link  = f"https://github.com/{repo}"
-    header = (f'<h3 style="margin:20px 0 8px; font-family:ui-sans-serif,system-ui,Arial;">'
-              f'<a href="{repo_link}" style="text-decoration:none; color:#24292f;">{html.escape(repo)}</a></h3>')
-    table = f"""
-    <table role="grid" style="border-collapse:collapse; width:100%; max-width:100%; font-family:ui-sans-serif,system-ui,Arial; font-size:14px;">
-      <thead>
-        <tr style="background:#f6f8fa;">
-          <th style="padding:8px; border:1px solid #ddd; text-align:left;">Issue</th>
-          <th style="padding:8px; border:1px solid #ddd; text-align:left;">Title</th>
-          <th style="padding:8px; border:1px solid #ddd; text-align:left;">Labels</th>
-          <th style="padding:8px; border:1px solid #ddd; text-align:left;">Assignees</th>
-          <th style="padding:8px; border:1px solid #ddd; text-align:left;">State</th>
-          <th style="padding:8px; border:1px solid #ddd; text-align:left;">Updated</th>
-          <th style="padding:8px; border:1px solid #ddd; text-align:left;">Created</th>
-        </tr>
-      </thead>
-      <tbody>
-        {''.join(rows)}
-      </tbody>
-    </table>
-    """
-    return header + table
+        w(row({
+            "url": it.get("html_url"),
+            "num": it.get("number"),
+            "title": escape(it.get("title", "")),
+            "labels": "".join([label_span(lb) for lb in it.get("labels", [])]),
+            "assignees": ", ".join([a.get("login","") for a in assignees]) if assignees else "--",
+            "state": (it.get("state") or "").lower() or "—",
+            "updated": it.get("updated_at",""),
+            "created": it.get("created_at",""),
+        }))
+
+    w(_TABLE_TAIL)
 
 def build_html_report_by_query(grouped_by_query_repo, since_iso, per_query_counts):
     if not grouped_by_query_repo:
-        return (f'<div style="font-family:ui-sans-serif,system-ui,Arial; font-size:14px;">'
-                f'No update since: {html.escape(since_iso)} </div>')
+        return f'{_WRAPPER_OPEN}No update since: {html.escape(since_iso)} </div>'
 
-    parts = [f'<div style="margin:0 0 16px; color:#57606a; font-family:ui-sans-serif,system-ui,Arial;">Time window: since {html.escape(since_iso)}</div>']
+    out = [_WRAPPER_OPEN,
+           f'<div style="margin:0 0 16px; color:#57606a; {_FONT}">Time window: since {html.escape(since_iso)}</div>']
+    w = out.append
     for qname in sorted(grouped_by_query_repo.keys()):
         count = per_query_counts.get(qname, 0)
-        parts.append(f'<h2 style="margin:12px 0 8px; font-family:ui-sans-serif,system-ui,Arial;">Query: {html.escape(qname)} ({plural(count, "result")})</h2>')
+        w(f'<h2 style="margin:12px 0 8px; {_FONT}">Query: {html.escape(qname)} ({plural(count, "result")})</h2>')
         repo_map = grouped_by_query_repo[qname]
         for repo in sorted(repo_map.keys()):
-            parts.append(html_table_for_repo(repo, repo_map[repo]))
+            write_repo_table(out, repo, repo_map[repo])
 
-    return '<div style="font-family:ui-sans-serif,system-ui,Arial; font-size:14px;">' + "".join(parts) + '<div style="margin-top:16px; color:#57606a;">-- Powered by Zealot</div></div>'
+    w(_WRAPPER_CLOSE)
+    return "".join(out)
 
 def build_text_fallback_by_query(grouped_by_query_repo, since_iso, per_query_counts):
     if not grouped_by_query_repo:
         return f"No update since: {since_iso}\n"
     lines = [f"Github Issue Update since: {since_iso}"]
+    w = lines.append
     for qname in sorted(grouped_by_query_repo.keys()):
-        lines.append(f"\n### Query: {qname} ({plural(per_query_counts.get(qname,0), 'result')})")
+        w(f"\n### Query: {qname} ({plural(per_query_counts.get(qname,0), 'result')})")
         repo_map = grouped_by_query_repo[qname]
         for repo in sorted(repo_map.keys()):
-            lines.append(f"\n## {repo}")
+            w(f"\n## {repo}")
             for it in repo_map[repo]:
                 labels = ", ".join([lb.get("name","") for lb in it.get("labels", [])])
                 assignees = ", ".join([a.get("login","") for a in (it.get("assignees") or [])]) or "--"
                 state = (it.get("state") or "--")
-                lines.append(f"- #{it.get('number')} {it.get('title')} [{it.get('html_url')}]")
-                lines.append(f"  labels: {labels} | assignees: {assignees} | state: {state}")
-                lines.append(f"  updated: {it.get('updated_at','')}  created: {it.get('created_at','')}")
-    lines.append("\n-- Powered by Zealot")
+                w(f"- #{it.get('number')} {it.get('title')} [{it.get('html_url')}]")
+                w(f"  labels: {labels} | assignees: {assignees} | state: {state}")
+                w(f"  updated: {it.get('updated_at','')}  created: {it.get('created_at','')}")
+    w("\n-- Powered by Zealot")
     return "\n".join(lines)
 
+class SmtpPool:
+    def __init__(self, host, port, user, password, idle_timeout=30):
+        self.host, self.port = host, port
+        self.user, self.password = user, password
+        self.idle_timeout = idle_timeout
+        self._conns = []  # (smtplib.SMTP, last_used)
+        self._lock = threading.Lock()
+        self._ctx = None
+
+    def _dial(self):
+        if self._ctx is None:
+            self._ctx = ssl.create_default_context()
+        s = smtplib.SMTP(self.host, self.port)
+        try:
+            s.ehlo()
+            s.starttls(context=self._ctx)
+            s.ehlo()
+            s.login(self.user, self.password)
+        except Exception:
+            s.close()
+            raise
+        return s
+
+    @staticmethod
+    def _quit(conn):
+        try:
+            conn.quit()
+        except (smtplib.SMTPException, OSError):
+            conn.close()
+
+    def get(self):
+        now = time.monotonic()
+        while True:
+            with self._lock:
+                if not self._conns:
+                    break
+                conn, last_used = self._conns.pop()
+            if now - last_used >= self.idle_timeout:
+                self._quit(conn)
+                continue
+            try:
+                if conn.noop()[0] == 250:
+                    return conn
+            except (smtplib.SMTPException, OSError):
+                pass
+            conn.close()
+        return self._dial()
+
+    def put(self, conn):
+        with self._lock:
+            self._conns.append((conn, time.monotonic()))
+
+    def discard(self, conn):
+        self._quit(conn)
+
+    def close(self):
+        with self._lock:
+            conns, self._conns = self._conns, []
+        for conn, _ in conns:
+            self._quit(conn)
+
+SMTP_POOL = SmtpPool(SMTP_HOST, SMTP_PORT, SMTP_USER, SMTP_PASS, idle_timeout=SMTP_IDLE_TIMEOUT)
+
+MIME_BOUNDARY = "=_zealot_" + uuid.uuid4().hex
+
+def _mime_part(subtype, body):
+    return (f'--{MIME_BOUNDARY}\r\nContent-Type: text/{subtype}; charset="utf-8"\r\n'
+            f'Content-Transfer-Encoding: base64\r\n\r\n').encode("ascii") + \
+           base64.encodebytes(body.encode("utf-8")).replace(b"\n", b"\r\n")
+
+def _encode_address(value):
+    name, addr = parseaddr(value)
+    return formataddr((name, addr), "utf-8") if addr else value
+
+def build_mime_message(subject, html_body, text_fallback):
+    if not subject.isascii():
+        subject = Header(subject, "utf-8").encode()
+    head = (f"Subject: {subject}\r\nFrom: {_encode_address(MAIL_FROM)}\r\nTo: {_encode_address(MAIL_TO)}\r\n"
+            f"Date: {formatdate(localtime=True)}\r\nMIME-Version: 1.0\r\n"
+            f'Content-Type: multipart/alternative; boundary="{MIME_BOUNDARY}"\r\n\r\n')
+    return b"".join([head.encode("utf-8"),
+                     _mime_part("plain", text_fallback),
+                     _mime_part("html", html_body),
+                     f"--{MIME_BOUNDARY}--\r\n".encode("ascii")])
+
 def send_email_html(subject, html_body, text_fallback):
     if not (SMTP_HOST and SMTP_USER and SMTP_PASS and MAIL_TO and MAIL_FROM and SMTP_PORT):
         return False
-    msg = MIMEMultipart("alternative")
-    msg["Subject"] = subject
-    msg["From"] = MAIL_FROM
-    msg["To"] = MAIL_TO
-    msg["Date"] = formatdate(localtime=True)
-
-    msg.attach(MIMEText(text_fallback, "plain", "utf-8"))
-    msg.attach(MIMEText(html_body, "html", "utf-8"))
-
-    ctx = ssl.create_default_context()
-    with smtplib.SMTP(SMTP_HOST, SMTP_PORT) as s:
-        s.ehlo()
-        s.starttls(context=ctx)
-        s.ehlo()
-        s.login(SMTP_USER, SMTP_PASS)
-        s.sendmail(MAIL_FROM, [MAIL_TO], msg.as_string())
+    msg = build_mime_message(subject, html_body, text_fallback)
+
+    conn = SMTP_POOL.get()
+    try:
+        conn.sendmail(MAIL_FROM, [MAIL_TO], msg)
+    except Exception:
+        SMTP_POOL.discard(conn)
+        raise
+    SMTP_POOL.put(conn)
     return True
 
-def send_tg(text_content):
+async def send_tg(client, text_content):
     if not (TG_BOT_TOKEN and TG_CHAT_ID):
         return False
     url = f"https://api.telegram.org/bot{TG_BOT_TOKEN}/sendMessage"
     payload = {"chat_id": TG_CHAT_ID, "text": text_content, "disable_web_page_preview": True}
-    r = requests.post(url, json=payload, timeout=HTTP_TIMEOUT)
+    r = await client.post(url, content=orjson.dumps(payload), headers={"Content-Type": "application/json"})
     try:
         r.raise_for_status()
         return True
@@ -260,69 +438,75 @@ def send_tg(text_content):
         print("[WARN] Telegram Sent Failed", r.text, file=sys.stderr)
         return False
 
-def main():
+async def watch(client, sem):
     now = datetime.datetime.now(datetime.UTC)
     since = now - datetime.timedelta(minutes=INTERVAL_MIN)
     since_iso = iso_utc(since)
+    since_ts = since.timestamp()
+    since_http = formatdate(since_ts, usegmt=True)
 
-    grouped_by_query_repo = defaultdict(lambda: defaultdict(list))
+    grouped_by_query_repo = {}
     per_query_counts = {}
 
-    timeline_checks = 0
+    tasks = [gh_search(q["q"], since_iso, since_http, client, sem) for q in ALL_QUERIES]
+    results = await asyncio.gather(*tasks, return_exceptions=True)
 
-    for q in ALL_QUERIES:
+    # (qname, issue) pairs that are open, unassigned and updated in the window
+    candidates = []
+    candidates_append = candidates.append
+    fromisoformat = datetime.datetime.fromisoformat
+    for q, items in zip(ALL_QUERIES, results):
         qname = q.get("name") or q.get("q")[:40]
-        try:
-            items = gh_search(q["q"], since_iso)
-        except Exception as e:
-            print(f"[ERR] Query failed: {qname}: {e}", file=sys.stderr)
+        if isinstance(items, BaseException):
+            print(f"[ERR] Query failed: {qname}: {items}", file=sys.stderr)
             continue
 
+        per_query_counts[qname] = 0
         seen_urls_in_this_query = set()
-        kept = 0
+        seen_add = seen_urls_in_this_query.add
 
         for it in items:
-            upd = it.get("updated_at")
+            _get = it.get
+            upd = _get("updated_at")
             if upd:
                 try:
-                    if datetime.datetime.strptime(upd, "%Y-%m-%dT%H:%M:%SZ").replace(tzinfo=datetime.UTC) < since:
+                    if fromisoformat(upd).timestamp() < since_ts:
                         continue
-                except Exception:
+                except ValueError:
                     pass
 
-            state = (it.get("state") or "").lower()
-            if state != "open":
+            if (_get("state") or "").lower() != "open":
                 continue
-            assignees = it.get("assignees") or []
-            if assignees:
+            if _get("assignees"):
                 continue
-            if FILTER_LINKED_PR == "1" and timeline_checks < MAX_TIMELINE_CHECKS:
-                repo_full = "/".join(it["repository_url"].split("/")[-2:])
-                num = it.get("number")
-                try:
-                    if issue_has_open_linked_pr(repo_full, num):
-                        timeline_checks += 1
-                        continue
-                finally:
-                    timeline_checks += 1
 
-            url = it.get("html_url")
+            url = _get("html_url")
             if not url or url in seen_urls_in_this_query:
                 continue
-            seen_urls_in_this_query.add(url)
+            seen_add(url)
+            candidates_append((qname, it))
 
-            repo = "/".join(it["repository_url"].split("/")[-2:])
-            grouped_by_query_repo[qname][repo].append(it)
-            kept += 1
+    keys = [(repo_full_name(it), it["number"]) for _, it in candidates]
 
-        per_query_counts[qname] = kept
+    # An issue matched by several queries is probed once; only the first
+    # MAX_TIMELINE_CHECKS unique issues are probed, the rest are kept as-is.
+    if FILTER_LINKED_PR == "1":
+        to_probe = [k for k in dict.fromkeys(keys) if k not in checked_cache][:MAX_TIMELINE_CHECKS]
+        linked = await asyncio.gather(*[issue_has_open_linked_pr(client, sem, repo, num) for repo, num in to_probe])
+        checked_cache.update(zip(to_probe, linked))
+
+    for (qname, it), key in zip(candidates, keys):
+        if checked_cache.get(key, False):
+            continue
+        grouped_by_query_repo.setdefault(qname, {}).setdefault(key[0], []).append(it)
+        per_query_counts[qname] += 1
 
     total = sum(per_query_counts.values())
 
     html_report = build_html_report_by_query(grouped_by_query_repo, since_iso, per_query_counts)
     text_report = build_text_fallback_by_query(grouped_by_query_repo, since_iso, per_query_counts)
-    Path("notify.html").write_text(html_report, encoding="utf-8")
-    Path("notify.txt").write_text(text_report, encoding="utf-8")
+    write_report("notify.html", html_report)
+    write_report("notify.txt", text_report)
 
     gh_out = os.getenv("GITHUB_OUTPUT")
     if gh_out:
@@ -336,8 +520,22 @@ def main():
 
     subject = f"[Zealot] {plural(total, 'unassigned open issue')} across {plural(len([k for k in per_query_counts if per_query_counts[k]>0]), 'query')}"
     mail_ok = send_email_html(subject, html_report, text_report)
-    tg_ok   = send_tg(text_report)
+    tg_ok   = await send_tg(client, text_report)
     print(f"[OK] Sent email: {mail_ok}, telegram: {tg_ok}")
 
+async def main_async():
+    sem = asyncio.Semaphore(CONCURRENCY)
+    load_http_cache()
+    try:
+        limits = httpx.Limits(max_connections=8, max_keepalive_connections=8)
+        async with httpx.AsyncClient(http2=True, timeout=HTTP_TIMEOUT, limits=limits, follow_redirects=True) as client:
+            await watch(client, sem)
+    finally:
+        save_http_cache()
+        SMTP_POOL.close()
+
+def main():
+    asyncio.run(main_async())
+
 if __name__ == "__main__":
     main()